@@ -20,12 +20,21 @@ Usage:
 from __future__ import annotations
 
 import ast
+import hashlib
 import importlib.util
+import io
+import json
+import os
+import re
 import sys
+import tokenize
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from contextlib import nullcontext, redirect_stdout
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
 __version__ = "0.2.0"
 
@@ -36,44 +45,66 @@ __version__ = "0.2.0"
 _NO_COLOR = not sys.stdout.isatty()
 
 
-def _c(code: str, text: str) -> str:
-    if _NO_COLOR:
-        return text
-    return f"\033[{code}m{text}\033[0m"
+# Chosen once at import time so each call is a single f-string (or nothing).
+if _NO_COLOR:
 
+    def _identity(t: str) -> str:
+        return t
 
-def green(t: str) -> str:
-    return _c("32", t)
+    green = yellow = cyan = red = bold = dim = _identity
 
+else:
 
-def yellow(t: str) -> str:
-    return _c("33", t)
-
+    def green(t: str) -> str:
+        return f"\033[32m{t}\033[0m"
 
-def cyan(t: str) -> str:
-    return _c("36", t)
+    def yellow(t: str) -> str:
+        return f"\033[33m{t}\033[0m"
 
+    def cyan(t: str) -> str:
+        return f"\033[36m{t}\033[0m"
 
-def red(t: str) -> str:
-    return _c("31", t)
+    def red(t: str) -> str:
+        return f"\033[31m{t}\033[0m"
 
+    def bold(t: str) -> str:
+        return f"\033[1m{t}\033[0m"
 
-def bold(t: str) -> str:
-    return _c("1", t)
+    def dim(t: str) -> str:
+        return f"\033[2m{t}\033[0m"
 
 
-def dim(t: str) -> str:
-    return _c("2", t)
+# Status labels are a fixed set, so colorize them once up front.
+_LBL: dict[str, str] = {
+    name: fn(name)
+    for name, fn in [
+        ("updated ", green),
+        ("skip    ", dim),
+        ("dry-run ", yellow),
+        ("deps    ", cyan),
+        ("stdlib  ", dim),
+        ("local   ", dim),
+        ("none", dim),
+        ("error", red),
+        ("syntax error", red),
+        ("warn    ", yellow),
+        ("done", bold),
+    ]
+}
 
 
 # ---------------------------------------------------------------------------
 # Stdlib detection
 # ---------------------------------------------------------------------------
 
+# Names are interned, as are the tops produced by _top, so membership tests
+# usually succeed on pointer identity without comparing characters.
 if hasattr(sys, "stdlib_module_names"):
-    STDLIB_MODULES: set[str] = set(sys.stdlib_module_names)
+    STDLIB_MODULES: frozenset[str] = frozenset(
+        sys.intern(n) for n in sys.stdlib_module_names
+    )
 else:
-    STDLIB_MODULES = set()
+    STDLIB_MODULES = frozenset()
 
 
 # ---------------------------------------------------------------------------
@@ -95,32 +126,196 @@ class DependencyAnalysisResult:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
 def _top(name: str) -> str:
-    """Return the top-level package name from a dotted module path."""
-    return name.split(".", maxsplit=1)[0]
-
-
-def iter_imports(tree: ast.AST) -> Iterable[str]:
-    """Yield top-level module names from all import statements in *tree*.
+    """Return the (interned) top-level package name from a dotted module path."""
+    return sys.intern(name.split(".", maxsplit=1)[0])
+
+
+# Imports only ever appear in statement position, so the walk below descends
+# through statement bodies and never enters expression subtrees.  Each
+# container type maps to a getter for its child statements.
+_CHILDREN: dict[type, Callable[[Any], Iterable[ast.AST]]] = {
+    ast.Module: lambda n: n.body,
+    ast.FunctionDef: lambda n: n.body,
+    ast.AsyncFunctionDef: lambda n: n.body,
+    ast.ClassDef: lambda n: n.body,
+    ast.With: lambda n: n.body,
+    ast.AsyncWith: lambda n: n.body,
+    ast.ExceptHandler: lambda n: n.body,
+    ast.If: lambda n: (*n.body, *n.orelse),
+    ast.For: lambda n: (*n.body, *n.orelse),
+    ast.AsyncFor: lambda n: (*n.body, *n.orelse),
+    ast.While: lambda n: (*n.body, *n.orelse),
+    ast.Try: lambda n: (*n.body, *n.handlers, *n.orelse, *n.finalbody),
+}
+# Newer statement types, registered only where the running Python has them
+if hasattr(ast, "Match"):
+    _CHILDREN[ast.Match] = lambda n: n.cases
+    _CHILDREN[ast.match_case] = lambda n: n.body
+if hasattr(ast, "TryStar"):
+    _CHILDREN[ast.TryStar] = _CHILDREN[ast.Try]
+
+
+def visit_imports(tree: ast.AST, add: Callable[[str], None]) -> None:
+    """Call *add* with the top-level module name of every import in *tree*.
 
     Relative imports (``from .foo import bar``) are skipped — they are
     always local.
     """
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
+    # ``type(node) is`` checks don't narrow, hence Any
+    stack: list[Any] = [tree]
+    while stack:
+        node = stack.pop()
+        t = type(node)
+        if t is ast.Import:
             for alias in node.names:
                 if alias.name:
-                    yield _top(alias.name)
-        elif isinstance(node, ast.ImportFrom):
+                    add(_top(alias.name))
+        elif t is ast.ImportFrom:
             if node.level and node.level > 0:
                 continue
             if node.module:
-                yield _top(node.module)
+                add(_top(node.module))
+        else:
+            children = _CHILDREN.get(t)
+            if children:
+                stack.extend(children(node))
+
+
+# Line-anchored ``import a, b`` / ``from pkg import x`` statements.  Group 1
+# holds the names of a plain import, group 2 the leading dots and group 3
+# the module of a ``from`` import.
+_IMPORT_RE = re.compile(
+    r"^[ \t]*(?:import[ \t]+([\w.,\t ]+)|from[ \t]+(\.*)([\w.]*)[ \t]+import\b)",
+    re.MULTILINE,
+)
+_IMPORT_KW_RE = re.compile(r"\bimport\b")
+
+
+def scan_imports(source: str, add: Callable[[str], None]) -> bool:
+    """Call *add* with each top-level import name in *source*, without an AST.
+
+    Handles the common one-import-per-line layout.  Returns False, before
+    calling *add* at all, when the source contains anything the scan can't
+    be sure about — an ``import`` keyword it didn't match (``x; import y``,
+    ``try: import y``, strings, comments), a backslash line continuation,
+    or a match inside a triple-quoted string — so the caller can fall back
+    to :func:`visit_imports`.  Syntax is not checked.
+    """
+    # A continuation can split an import over lines or hide one inside a
+    # string, neither of which a line-anchored pattern can see
+    if "\\\n" in source or "\\\r" in source:
+        return False
 
+    matches = list(_IMPORT_RE.finditer(source))
+    if len(matches) != len(_IMPORT_KW_RE.findall(source)):
+        return False
 
-def is_stdlib(name: str) -> bool:
-    """Return True if *name* is a standard-library module."""
-    top = _top(name)
+    # With continuations ruled out only a triple-quoted string can span
+    # lines, so a match can only sit inside one if a triple quote comes
+    # first.  Quote counting is fooled by ``'"""'`` and comments, so ask
+    # the tokenizer where the strings really are.
+    last = matches[-1].start() if matches else 0
+    if source.find('"""', 0, last) >= 0 or source.find("'''", 0, last) >= 0:
+        spans = _string_rows(source, source.count("\n", 0, last) + 1)
+        if spans is None:
+            return False
+        pos = 0
+        row = 1
+        for m in matches:
+            row += source.count("\n", pos, m.start())
+            pos = m.start()
+            if any(start < row <= end for start, end in spans):
+                return False
+
+    for m in matches:
+        names, dots, module = m.groups()
+        if names is not None:
+            for part in names.split(","):
+                words = part.split()
+                if words:
+                    add(_top(words[0]))
+        elif not dots and module:
+            add(_top(module))
+    return True
+
+
+# Python 3.12+ tokenizes f-strings (and 3.14+ t-strings) as start / middle /
+# end tokens rather than a single STRING
+_STR_START = {
+    getattr(tokenize, n)
+    for n in ("FSTRING_START", "TSTRING_START")
+    if hasattr(tokenize, n)
+}
+_STR_END = {
+    getattr(tokenize, n) for n in ("FSTRING_END", "TSTRING_END") if hasattr(tokenize, n)
+}
+
+
+def _string_rows(source: str, last_row: int) -> list[tuple[int, int]] | None:
+    """Return the (first, last) rows of string literals spanning several lines.
+
+    Tokenizing stops after *last_row*.  Returns None if *source* can't be
+    tokenized.
+    """
+    spans: list[tuple[int, int]] = []
+    opened: list[int] = []
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.start[0] > last_row:
+                break
+            if tok.type == tokenize.STRING:
+                if tok.end[0] > tok.start[0]:
+                    spans.append((tok.start[0], tok.end[0]))
+            elif tok.type in _STR_START:
+                opened.append(tok.start[0])
+            elif tok.type in _STR_END and opened:
+                start = opened.pop()
+                if tok.end[0] > start:
+                    spans.append((start, tok.end[0]))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    # An f-string still open at *last_row* spans it too
+    spans.extend((start, last_row) for start in opened)
+    return spans
+
+
+def _prelude_end(source: str) -> int:
+    """Return the offset where the leading imports and docstrings of *source* end.
+
+    That is the start of the first top-level logical line that doesn't
+    begin with ``import``, ``from`` or a string literal.  Tokenizing stops
+    there, so the rest of the file is never looked at.
+    """
+    at_start = True
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type in (tokenize.NL, tokenize.COMMENT):
+                continue
+            if tok.type == tokenize.NEWLINE:
+                at_start = True
+                continue
+            if not at_start:
+                continue
+            at_start = False
+            if tok.type == tokenize.STRING or (
+                tok.type == tokenize.NAME and tok.string in ("import", "from")
+            ):
+                continue
+            if tok.type == tokenize.ENDMARKER:
+                break
+            pos = 0
+            for _ in range(tok.start[0] - 1):
+                pos = source.find("\n", pos) + 1
+            return pos
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return len(source)
+
+
+@lru_cache(maxsize=None)
+def _is_stdlib_cached(top: str) -> bool:
     if STDLIB_MODULES:
         return top in STDLIB_MODULES
     # Fallback for Python < 3.10: only trust built-ins
@@ -131,28 +326,131 @@ def is_stdlib(name: str) -> bool:
     return bool(spec and spec.origin == "built-in")
 
 
-def analyze(source: str, script_path: Path | None = None) -> DependencyAnalysisResult:
-    """Classify every imported module in *source* into stdlib / local / third-party."""
-    tree = ast.parse(source)
-    seen = sorted(set(iter_imports(tree)))
+def is_stdlib(name: str) -> bool:
+    """Return True if *name* is a standard-library module."""
+    return _is_stdlib_cached(_top(name))
+
+
+def _list_dir(d: Path) -> tuple[set[str], set[str]]:
+    """Return the ``*.py`` module names and subdirectory names in *d*."""
+    modules: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name.endswith(".py"):
+                    if e.is_file():
+                        modules.add(e.name[:-3])
+                elif e.is_dir():
+                    dirs.add(e.name)
+    except OSError:
+        pass
+    return modules, dirs
+
+
+def find_imports(
+    source: str, *, strict: bool = False, filename: str = "<uvs>"
+) -> list[str]:
+    """Return the top-level module names imported by *source*, first-seen order.
+
+    Imports are found with :func:`scan_imports` where possible.  When the
+    scan gives up only the import prelude is parsed if that is enough.
+    Neither checks syntax; with *strict* the full source is always parsed,
+    which raises :class:`SyntaxError` for invalid scripts.
+    """
+    # Every import statement contains the keyword, so without it there is
+    # nothing to find and, unless the syntax must be checked, the parse can
+    # be skipped.
+    if not strict and "import" not in source:
+        return []
+
+    # A dict doubles as an insertion-ordered set
+    found: dict[str, None] = {}
+    add = found.setdefault
+
+    if strict or not scan_imports(source, add):
+        # Outside strict mode, parse only the import prelude when no import
+        # keyword appears past it (lazy imports in functions, guarded
+        # imports under ``if`` / ``try`` all force a full parse).
+        end = len(source)
+        if not strict:
+            end = _prelude_end(source)
+            if _IMPORT_KW_RE.search(source, end):
+                end = len(source)
+        tree = ast.parse(
+            source[:end], filename=filename, mode="exec", type_comments=False
+        )
+        visit_imports(tree, add)
 
-    result = DependencyAnalysisResult()
-    for mod in seen:
-        top = _top(mod)
-        if is_stdlib(top):
-            result.stdlib.append(top)
+    return list(found)
+
+
+def classify(
+    tops: Iterable[str], script_path: Path | None = None
+) -> DependencyAnalysisResult:
+    """Sort top-level module names into stdlib / local / third-party.
+
+    *tops* must already be distinct, as returned by :func:`find_imports`.
+    A name is local when it matches a ``*.py`` file or a package directory
+    next to *script_path*.
+    """
+    tp: list[str] = []
+    sl: list[str] = []
+    lc: list[str] = []
+    listing: tuple[set[str], set[str]] | None = None
+
+    for top in tops:
+        if _is_stdlib_cached(top):
+            sl.append(top)
             continue
         if script_path:
             d = script_path.parent
-            if (d / f"{top}.py").exists() or (d / top / "__init__.py").exists():
-                result.local.append(top)
+            if listing is None:
+                listing = _list_dir(d)
+            modules, dirs = listing
+            if top in modules or (top in dirs and (d / top / "__init__.py").exists()):
+                lc.append(top)
                 continue
-        result.third_party.append(top)
+        tp.append(top)
+
+    return DependencyAnalysisResult(
+        third_party=sorted(tp),
+        stdlib=sorted(sl),
+        local=sorted(lc),
+    )
 
-    result.third_party = sorted(set(result.third_party))
-    result.stdlib = sorted(set(result.stdlib))
-    result.local = sorted(set(result.local))
-    return result
+
+def analyze(
+    source: str,
+    script_path: Path | None = None,
+    *,
+    strict: bool = False,
+) -> DependencyAnalysisResult:
+    r"""Classify every imported module in *source* into stdlib / local / third-party.
+
+    See :func:`find_imports` for how imports are found.  Syntax is only
+    checked with *strict*; otherwise an invalid script may still yield
+    results instead of raising :class:`SyntaxError`.
+
+    >>> analyze("import rich, \\\n    numpy\n").third_party
+    ['numpy', 'rich']
+    >>> analyze("from a \\\n  import b\n").third_party
+    ['a']
+    >>> analyze("x = 'a\\\nimport fake'\n").third_party
+    []
+    >>> q = '"' * 3
+    >>> analyze(f"s = '{q}'\nx = {q}\nimport fake\n{q}\n").third_party
+    []
+    >>> analyze("import numpy\ndef (:\n").third_party
+    ['numpy']
+    >>> analyze("import numpy\ndef (:\n", strict=True)
+    ... # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    SyntaxError: invalid syntax
+    """
+    filename = str(script_path) if script_path else "<uvs>"
+    imports = find_imports(source, strict=strict, filename=filename)
+    return classify(imports, script_path)
 
 
 # ---------------------------------------------------------------------------
@@ -161,6 +459,7 @@ def analyze(source: str, script_path: Path | None = None) -> DependencyAnalysisR
 
 _HDR_START = "# /// script"
 _HDR_END = "# ///"
+_DEP_RE = re.compile(r"[\"']([^\"'\r\n]+)[\"']")
 
 
 def _has_header(text: str) -> bool:
@@ -168,61 +467,174 @@ def _has_header(text: str) -> bool:
 
 
 def _build_header(deps: Iterable[str], python: str) -> str:
-    lines = [
-        _HDR_START,
-        f'# requires-python = "{python}"',
-        "# dependencies = [",
-        *[f'#   "{d}",' for d in sorted(set(deps))],
-        "# ]",
-        _HDR_END,
-    ]
-    return "\n".join(lines) + "\n\n"
+    dep_lines = "".join(f'#   "{d}",\n' for d in sorted(set(deps)))
+    return (
+        f"{_HDR_START}\n"
+        f'# requires-python = "{python}"\n'
+        f"# dependencies = [\n"
+        f"{dep_lines}"
+        f"# ]\n"
+        f"{_HDR_END}\n\n"
+    )
+
+
+def _prepend_header(original: str, deps: Iterable[str], python: str) -> str:
+    header = _build_header(deps, python)
+    # Match the file's line endings so CRLF files don't end up mixed
+    eol = original.find("\n")
+    if eol > 0 and original[eol - 1] == "\r":
+        header = header.replace("\n", "\r\n")
+    return header + original
 
 
 def inject_header(original: str, deps: Iterable[str], python: str) -> str:
-    """Insert or update the PEP 723 ``# /// script`` block in *original*.
+    r"""Insert or update the PEP 723 ``# /// script`` block in *original*.
 
     When a block already exists only the ``dependencies`` list is replaced;
-    all other fields (``tool.uv``, ``index``, …) are preserved.
+    all other fields (``tool.uv``, ``index``, …) are preserved, as is the
+    rest of the file byte for byte.
+
+    CRLF line endings carry over to the new dependency lines:
+
+    >>> crlf = "# /// script\r\n# dependencies = [\r\n# ]\r\n# ///\r\n"
+    >>> inject_header(crlf, ["rich"], ">=3.12")
+    '# /// script\r\n# dependencies = [\r\n#   "rich",\r\n# ]\r\n# ///\r\n'
+
+    A one-line ``dependencies`` entry is replaced in place:
+
+    >>> one_line = "# /// script\n# dependencies = []\n# ///\n"
+    >>> print(inject_header(one_line, ["rich"], ">=3.12"), end="")
+    # /// script
+    # dependencies = [
+    #   "rich",
+    # ]
+    # ///
+
+    A missing trailing newline stays missing:
+
+    >>> out = inject_header(one_line + "import rich", ["rich"], ">=3.12")
+    >>> out.endswith("# ]\n# ///\nimport rich")
+    True
+
+    When the listed deps already match, *original* itself is returned:
+
+    >>> src = '# /// script\n# dependencies = ["a", "b"]\n# ///\n'
+    >>> inject_header(src, ["b", "a"], ">=3.12") is src
+    True
+
+    Without a closing ``# ]`` the old list can't be delimited, so a complete
+    one is added before the end of the block:
+
+    >>> unclosed = "# /// script\n# dependencies = [\n# ///\n"
+    >>> print(inject_header(unclosed, ["rich"], ">=3.12"), end="")
+    # /// script
+    # dependencies = [
+    # dependencies = [
+    #   "rich",
+    # ]
+    # ///
     """
     deps_list = sorted(set(deps))
 
     if not _has_header(original):
-        return _build_header(deps_list, python) + original
+        return _prepend_header(original, deps_list, python)
 
-    lines = original.splitlines()
+    # Locate the existing block by offset so only the header is touched
+    start = original.find(_HDR_START)
+    body = original.find("\n", start) + 1
+    if not body:
+        return _prepend_header(original, deps_list, python)
 
-    # Locate the existing block
-    start = next((i for i, l in enumerate(lines) if _HDR_START in l), None)
-    if start is None:
-        return _build_header(deps_list, python) + original
+    end = original.find(_HDR_END, body)
+    if end < 0:
+        return _prepend_header(original, deps_list, python)
+    end = original.rfind("\n", 0, end) + 1  # start of the closing line
 
-    end = next((i for i in range(start + 1, len(lines)) if _HDR_END in lines[i]), None)
-    if end is None:
-        return _build_header(deps_list, python) + original
-
-    block = lines[start : end + 1]
-
-    # Find and replace the dependencies section inside the block
+    # Find the dependencies section inside the block
     dep_s = dep_e = None
-    for i, line in enumerate(block):
-        s = line.strip()
-        if s.startswith("#") and "dependencies" in s and "[" in s:
-            dep_s = i
-            for j in range(i + 1, len(block)):
-                if block[j].strip().startswith("# ]"):
-                    dep_e = j
+    pos = body
+    while pos < end:
+        eol = original.find("\n", pos, end) + 1 or end
+        s = original[pos:eol].strip()
+        if dep_s is None:
+            if s.startswith("#") and "dependencies" in s and "[" in s:
+                dep_s = pos
+                if s.endswith("]"):  # one-line ``dependencies = [...]``
+                    dep_e = eol
                     break
+        elif s.startswith("# ]"):
+            dep_e = eol
             break
+        pos = eol
 
-    new_dep = ["# dependencies = [", *[f'#   "{d}",' for d in deps_list], "# ]"]
+    # Already listing exactly these deps: hand back *original* untouched
+    if dep_s is not None and dep_e is not None:
+        if set(_DEP_RE.findall(original, dep_s, dep_e)) == set(deps_list):
+            return original
+
+    nl = "\r\n" if original[body - 2 : body] == "\r\n" else "\n"
+    new_dep = (
+        f"# dependencies = [{nl}"
+        + "".join(f'#   "{d}",{nl}' for d in deps_list)
+        + f"# ]{nl}"
+    )
 
     if dep_s is not None and dep_e is not None:
-        block = block[:dep_s] + new_dep + block[dep_e + 1 :]
-    else:
-        block = block[:-1] + new_dep + [block[-1]]
+        return original[:dep_s] + new_dep + original[dep_e:]
+    return original[:end] + new_dep + original[end:]
+
+
+# ---------------------------------------------------------------------------
+# Analysis cache
+# ---------------------------------------------------------------------------
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "uvs"
 
-    return "\n".join(lines[:start] + block + lines[end + 1 :]) + "\n"
+
+def _cache_entry(raw: bytes) -> Path:
+    # The Python version is part of the key because whether a source parses
+    # (what a ``parsed`` entry vouches for) depends on the grammar
+    prefix = f"{__version__}\0{sys.version_info[0]}.{sys.version_info[1]}\0"
+    key = hashlib.blake2b(prefix.encode() + raw, digest_size=16)
+    return CACHE_DIR / f"{key.hexdigest()}.json"
+
+
+def cached_find_imports(
+    source: str,
+    *,
+    strict: bool = False,
+    filename: str = "<uvs>",
+    raw: bytes | None = None,
+) -> list[str]:
+    """Like :func:`find_imports`, but reuse a previous result for unchanged input.
+
+    Entries are keyed by the source and the Python version: only the raw
+    import names are stored, and classification (which depends on
+    neighbouring files) runs fresh every time.  An entry records whether it
+    came from a full parse, so *strict* never trusts one that didn't.
+    *raw* is the UTF-8 encoded *source*, when the caller already has it.
+
+    Cache read / write failures are ignored — the cache is only an
+    optimisation.
+    """
+    if raw is None:
+        raw = source.encode("utf-8")
+    entry = _cache_entry(raw)
+    try:
+        data = json.loads(entry.read_bytes())
+        if data["parsed"] or not strict:
+            return list(data["imports"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    imports = find_imports(source, strict=strict, filename=filename)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with entry.open("w", encoding="utf-8") as f:
+            json.dump({"imports": imports, "parsed": strict}, f)
+    except OSError:
+        pass
+    return imports
 
 
 # ---------------------------------------------------------------------------
@@ -236,49 +648,128 @@ def process_file(
     python: str,
     dry_run: bool,
     verbose: bool,
+    strict: bool = False,
+    cache: bool = True,
 ) -> bool:
     """Analyse *path* and write the updated source.  Returns True on success."""
     try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        print(f"  {red('error')} {exc}")
+        raw = path.read_bytes()
+        source = raw.decode("utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"  {_LBL['error']} {exc}")
         return False
 
+    def analyse(full: bool) -> tuple[DependencyAnalysisResult, str]:
+        if cache:
+            imports = cached_find_imports(
+                source, strict=full, filename=str(path), raw=raw
+            )
+        else:
+            imports = find_imports(source, strict=full, filename=str(path))
+        result = classify(imports, path)
+        return result, inject_header(source, result.third_party, python)
+
     try:
-        result = analyze(source, script_path=path)
+        result, new_source = analyse(strict)
+        # The fast paths don't check syntax, so a file that is about to be
+        # rewritten (or previewed) always gets a full parse first
+        if not strict and (dry_run or new_source != source):
+            result, new_source = analyse(True)
     except SyntaxError as exc:
-        print(f"  {red('syntax error')} {exc}")
+        print(f"  {_LBL['syntax error']} {exc}")
         return False
 
     if verbose:
         if result.stdlib:
-            print(f"  {dim('stdlib  ')} {dim(', '.join(result.stdlib))}")
+            print(f"  {_LBL['stdlib  ']} {dim(', '.join(result.stdlib))}")
         if result.local:
-            print(f"  {dim('local   ')} {dim(', '.join(result.local))}")
-
-    deps_str = ", ".join(result.third_party) if result.third_party else dim("none")
-    print(f"  {cyan('deps    ')} {deps_str}")
+            print(f"  {_LBL['local   ']} {dim(', '.join(result.local))}")
 
-    new_source = inject_header(source, result.third_party, python)
+    deps_str = ", ".join(result.third_party) if result.third_party else _LBL["none"]
+    print(f"  {_LBL['deps    ']} {deps_str}")
 
     if dry_run:
-        print(f"  {yellow('dry-run ')} no changes written")
+        print(f"  {_LBL['dry-run ']} no changes written")
         return True
 
     if new_source == source:
-        print(f"  {dim('skip    ')} already up-to-date")
+        print(f"  {_LBL['skip    ']} already up-to-date")
         return True
 
     try:
-        path.write_text(new_source, encoding="utf-8")
+        new_raw = new_source.encode("utf-8")
+        path.write_bytes(new_raw)
     except OSError as exc:
-        print(f"  {red('error')} {exc}")
+        print(f"  {_LBL['error']} {exc}")
         return False
 
-    print(f"  {green('updated ')} PEP 723 header written")
+    if cache:
+        # Only header comments changed, so the imports are the same: re-key
+        # the entry instead of leaving one behind per rewrite
+        try:
+            os.replace(_cache_entry(raw), _cache_entry(new_raw))
+        except OSError:
+            pass
+
+    print(f"  {_LBL['updated ']} PEP 723 header written")
     return True
 
 
+def _run_one(
+    arg: str, *, python: str, dry_run: bool, verbose: bool, strict: bool, cache: bool
+) -> str:
+    """Check and process a single CLI argument.
+
+    Returns ``"ok"``, ``"error"`` or ``"skipped"``.
+    """
+    path = Path(arg)
+    print(bold(str(path)))
+
+    if not path.exists():
+        print(f"  {_LBL['warn    ']} file not found, skipping")
+        return "skipped"
+    if path.suffix != ".py":
+        print(f"  {_LBL['warn    ']} not a .py file, skipping")
+        return "skipped"
+
+    success = process_file(
+        path,
+        python=python,
+        dry_run=dry_run,
+        verbose=verbose,
+        strict=strict,
+        cache=cache,
+    )
+    return "ok" if success else "error"
+
+
+def _worker(
+    path_str: str, python: str, dry_run: bool, verbose: bool, strict: bool, cache: bool
+) -> tuple[str, str, str]:
+    """Run :func:`_run_one` with stdout captured.
+
+    Output is returned instead of printed so the caller can emit each
+    file's lines with a single write, in argument order — also when
+    running in a process pool.
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        status = _run_one(
+            path_str,
+            python=python,
+            dry_run=dry_run,
+            verbose=verbose,
+            strict=strict,
+            cache=cache,
+        )
+    return path_str, status, buf.getvalue()
+
+
+# Below this many scripts the cost of starting worker processes outweighs
+# the parallel speed-up.
+_PARALLEL_MIN_SCRIPTS = 4
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -290,6 +781,8 @@ examples:
   uvs --dry-run script.py          # preview without writing
   uvs --python ">=3.11" script.py  # set minimum Python version
   uvs --verbose script.py          # show stdlib & local modules too
+  uvs --strict script.py           # also syntax-check up-to-date files
+  uvs --no-cache script.py         # bypass the import cache
 
 after conversion run your script with:
   uv run script.py
@@ -325,6 +818,21 @@ def build_parser() -> ArgumentParser:
         action="store_true",
         help="also show stdlib and local modules",
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help=(
+            "always parse the full AST (slower). Files that are about to be "
+            "rewritten are always syntax-checked; this also checks files that "
+            "are already up-to-date"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="don't read or write the import cache in ~/.cache/uvs",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -341,31 +849,33 @@ def main() -> None:
         parser.print_help()
         raise SystemExit(0)
 
-    ok = errors = skipped = 0
-
-    for arg in args.scripts:
-        path = Path(arg)
-        print(bold(str(path)))
-
-        if not path.exists():
-            print(f"  {yellow('warn    ')} file not found, skipping")
-            skipped += 1
-            continue
-        if path.suffix != ".py":
-            print(f"  {yellow('warn    ')} not a .py file, skipping")
-            skipped += 1
-            continue
-
-        success = process_file(
-            path,
-            python=args.python,
-            dry_run=args.dry_run,
-            verbose=args.verbose,
-        )
-        if success:
-            ok += 1
-        else:
-            errors += 1
+    n = len(args.scripts)
+    jobs = (
+        args.scripts,
+        repeat(args.python),
+        repeat(args.dry_run),
+        repeat(args.verbose),
+        repeat(args.strict),
+        repeat(args.cache),
+    )
+    workers = min(os.cpu_count() or 1, n)
+    pool = None
+    if n >= _PARALLEL_MIN_SCRIPTS and workers >= 2:
+        # Imported here: it pulls in multiprocessing, which small runs
+        # never need
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+    statuses = []
+    with pool or nullcontext():
+        results = pool.map(_worker, *jobs, chunksize=4) if pool else map(_worker, *jobs)
+        for _, status, output in results:
+            sys.stdout.write(output)
+            statuses.append(status)
+
+    ok = statuses.count("ok")
+    errors = statuses.count("error")
+    skipped = statuses.count("skipped")
 
     # Summary line
     parts = [green(f"{ok} updated")]
@@ -373,7 +883,8 @@ def main() -> None:
         parts.append(yellow(f"{skipped} skipped"))
     if errors:
         parts.append(red(f"{errors} failed"))
-    print(f"\n{bold('done')}  {' · '.join(parts)}")
+    print(f"\n{_LBL['done']}  {' · '.join(parts)}")
+    sys.stdout.flush()
 
     if errors:
         raise SystemExit(1)